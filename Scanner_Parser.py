@@ -1,228 +1,366 @@
 import re
-from typing import List, Tuple, Optional
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional
+
+# ---------------- Tokens ----------------
+class Kind(IntEnum):
+    """Token types produced by the scanner."""
+
+    NUMBER = 0
+    ID = 1
+    OP = 2
+    KEYWORD = 3
+    SEMI = 4
+    LPAREN = 5
+    RPAREN = 6
+    LBRACE = 7
+    RBRACE = 8
+    EOF = 9
+
+    def __repr__(self) -> str:
+        # Printed tokens and error messages show the bare type name, e.g. ('ID', 'x').
+        return repr(self.name)
+
+
+# Module-level aliases for the members: looking a member up on the Enum class
+# is several times slower than a global lookup, and the parser does it per token.
+NUMBER, ID, OP, KEYWORD, SEMI, LPAREN, RPAREN, LBRACE, RBRACE, EOF = Kind
+
 
 # ---------------- Scanner ----------------
+# Identifiers that the scanner reports as KEYWORD tokens.
+_KEYWORDS = frozenset({
+    'int', 'float', 'double', 'bool', 'if', 'else', 'while',
+    'for', 'true', 'false', 'return', 'main'
+})
+
+# Regex patterns for token types, compiled once into a single master pattern.
+# Whitespace has no rule of its own: the master pattern starts with \s*, so the
+# gap before a token is consumed by the same match as the token, outside of its
+# group. A run that is not followed by a token (trailing blanks, or blanks before
+# a character no rule accepts) falls through to the bare \s+ branch and is eaten
+# by one group-less match, which the scanner drops. Without that branch finditer()
+# would retry \s* from every position of the run, which is quadratic in its
+# length. Any other character that matches no rule is stepped over by finditer().
+#
+# The rules start with disjoint sets of characters, so at most one of them can
+# match at a given position, and they are listed from most to least frequent in
+# typical code. OP shares prefixes (\+\+?, --?) instead of listing each form.
+_TOKEN_SPEC: List[Tuple[str, str]] = [
+    ('ID', r'[A-Za-z_]\w*'),
+    ('PUNCT', r'[;(){}]'),
+    ('OP', r'[=!<>]=|&&|\|\||\+\+?|--?|[*/%=<>]'),
+    ('NUMBER', r'\d+(?:\.\d*)?'),
+]
+_TOKEN_RE = re.compile(
+    r'\s*(?:' + '|'.join(f'(?P<{name}>{regex})' for name, regex in _TOKEN_SPEC) + r')|\s+'
+)
+# Token type by group number, so matches can be classified through ``lastindex``.
+# The patterns above must not contain capturing groups of their own. PUNCT has
+# no type of its own and maps to None.
+_GROUP_KINDS = {index: Kind.__members__.get(name) for name, index in _TOKEN_RE.groupindex.items()}
+# Token types fixed by the token text alone. They override the type of the group
+# that matched: keywords come out of the ID rule, and the single-character tokens
+# share the PUNCT rule. Keywords are recognized here, not in the regex.
+_VALUE_KINDS = dict.fromkeys(_KEYWORDS, KEYWORD)
+_VALUE_KINDS.update({';': SEMI, '(': LPAREN, ')': RPAREN, '{': LBRACE, '}': RBRACE})
+
+
 class Scanner:
     """
     Scanner (Lexer) for a simplified C++ subset.
 
     Attributes:
         code (str): The source code to tokenize.
-        tokens (List[Tuple[str, str]]): List of generated tokens.
-        keywords (set): Set of recognized keywords.
-        token_specification (List[Tuple[str, str]]): Regex patterns for token types.
+        tokens (List[Tuple[Kind, str]]): List of generated tokens.
     """
     
     def __init__(self, code: str) -> None:
         self.code: str = code
-        self.tokens: List[Tuple[str, str]] = []
-        self.keywords: set = {
-            'int', 'float', 'double', 'bool', 'if', 'else', 'while', 
-            'for', 'true', 'false', 'return', 'main'
-        }
-        self.token_specification: List[Tuple[str, str]] = [
-            ('NUMBER', r'\d+(\.\d*)?'),
-            ('ID', r'[A-Za-z_]\w*'),
-            ('OP', r'==|!=|<=|>=|&&|\|\||\+\+|--|[+\-*/%=<>]'),
-            ('SEMI', r';'),
-            ('LPAREN', r'\('),
-            ('RPAREN', r'\)'),
-            ('LBRACE', r'\{'),
-            ('RBRACE', r'\}'),
-            ('SKIP', r'[ \t]+'),
-            ('NEWLINE', r'\n'),
-        ]
-        self.token_regex: str = '|'.join(
-            f'(?P<{name}>{regex})' for name, regex in self.token_specification
-        )
-
-    def tokenize(self) -> List[Tuple[str, str]]:
+        self.tokens: List[Tuple[Kind, str]] = []
+
+    def tokenize(self) -> List[Tuple[Kind, str]]:
         """
         Tokenize the source code into a list of tokens.
         
         Returns:
             List of tuples (token_type, token_value)
         """
-        for mo in re.finditer(self.token_regex, self.code):
-            kind: str = mo.lastgroup
-            value: str = mo.group()
-            if kind == 'ID' and value in self.keywords:
-                kind = 'KEYWORD'
-            elif kind in {'SKIP', 'NEWLINE'}:
-                continue
-            self.tokens.append((kind, value))
+        # The list is built in bulk over the collected matches, which is
+        # cheaper than an append call per token. Each kind is
+        # _VALUE_KINDS.get(value, <kind of the matching group>).
+        matches = [mo for mo in _TOKEN_RE.finditer(self.code) if mo.lastindex]
+        group_kinds = _GROUP_KINDS
+        values = [mo.group(mo.lastindex) for mo in matches]
+        self.tokens = list(zip(
+            map(_VALUE_KINDS.get, values, [group_kinds[mo.lastindex] for mo in matches]),
+            values,
+        ))
         return self.tokens
 
+    def iter_tokens(self) -> Iterator[Tuple[Kind, str]]:
+        """
+        Lazily yield (token_type, token_value) pairs from the source code.
+
+        Unlike tokenize(), nothing is stored on the scanner; feeding this to a
+        Parser scans and parses in a single pass.
+        """
+        value_kind = _VALUE_KINDS.get
+        group_kinds = _GROUP_KINDS
+        for mo in _TOKEN_RE.finditer(self.code):
+            index = mo.lastindex
+            if index is None:
+                continue  # whitespace not followed by a token
+            value = mo.group(index)
+            yield value_kind(value, group_kinds[index]), value
+
 
 # ---------------- Parser ----------------
+_TYPE_KW = frozenset({'int', 'float', 'double', 'bool'})
+_BIN_OPS = frozenset({
+    '+', '-', '*', '/', '%', '||', '&&', '==', '!=', '<', '<=', '>', '>='
+})
+# Whole (kind, value) tokens that continue an expression, so the lookahead can be
+# tested with a single hash lookup.
+_BINOP_PAIRS = frozenset((OP, op) for op in _BIN_OPS)
+_TERM_KINDS = frozenset({NUMBER, ID, KEYWORD})
+_ASSIGN: Tuple[Kind, str] = (OP, '=')
+_EOF_TOKEN: Tuple[Kind, str] = (EOF, '')
+
+
 class Parser:
     """
     Recursive descent parser for the simplified C++ subset.
 
+    Tokens are pulled from the input one at a time with a single token of
+    lookahead, so the parser can consume Scanner.iter_tokens() directly
+    without the token list ever being built.
+
     Attributes:
-        tokens (List[Tuple[str, str]]): List of tokens from the scanner.
-        pos (int): Current position in the tokens list.
+        tokens (Iterator[Tuple[Kind, str]]): Tokens not yet read.
+        tok (Tuple[Kind, str]): Current token, or (EOF, '') at the end.
+        error (Optional[str]): First syntax error found, or None.
     """
     
-    def __init__(self, tokens: List[Tuple[str, str]]) -> None:
-        self.tokens: List[Tuple[str, str]] = tokens
-        self.pos: int = 0
+    def __init__(self, tokens: Iterable[Tuple[Kind, str]]) -> None:
+        self.tokens: Iterator[Tuple[Kind, str]] = iter(tokens)
+        self.tok: Tuple[Kind, str] = next(self.tokens, _EOF_TOKEN)
+        self.error: Optional[str] = None
 
-    def peek(self) -> Tuple[str, str]:
-        """Return the current token or ('EOF', '') if at the end."""
-        return self.tokens[self.pos] if self.pos < len(self.tokens) else ('EOF', '')
+    def peek(self) -> Tuple[Kind, str]:
+        """Return the current token or (EOF, '') if at the end."""
+        return self.tok
 
     def advance(self) -> None:
         """Move to the next token."""
-        self.pos += 1
+        self.tok = next(self.tokens, _EOF_TOKEN)
 
-    def match(self, expected_type: str, expected_value: Optional[str] = None) -> bool:
+    def match(self, expected_type: Kind, expected_value: Optional[str] = None) -> bool:
         """
         Match the current token against expected type and optionally value.
         
         Returns:
             True if matched and advances, False otherwise.
         """
-        tok_type, tok_val = self.peek()
+        tok_type, tok_val = self.tok
         if tok_type == expected_type and (expected_value is None or tok_val == expected_value):
             self.advance()
             return True
         return False
 
+    def fail(self, message: str) -> bool:
+        """
+        Record a syntax error unless a nested rule already recorded one.
+
+        Returns:
+            False, so rules can report and bail out with ``return self.fail(...)``.
+        """
+        if self.error is None:
+            self.error = message
+        return False
+
     def parse(self) -> None:
         """
-        Parse the token list. Prints "Code accepted." if successful,
+        Parse the token stream. Prints "Code accepted." if successful,
         otherwise prints syntax error.
         """
         try:
             # Optional main function
-            if self.match('KEYWORD', 'int') and self.match('KEYWORD', 'main') and self.match('LPAREN') and self.match('RPAREN'):
+            if self.match(KEYWORD, 'int') and self.match(KEYWORD, 'main') and self.match(LPAREN) and self.match(RPAREN):
                 if not self.block():
-                    raise SyntaxError("Missing block after main()")
-            while self.pos < len(self.tokens):
+                    self.fail("Missing block after main()")
+            while self.error is None and self.tok[0] != EOF:
                 if not self.statement():
-                    raise SyntaxError(f"Unexpected token: {self.peek()}")
+                    self.fail(f"Unexpected token: {self.peek()}")
+        except RecursionError:
+            # Every nested '(' or block costs a few Python frames; report input
+            # nested past the interpreter's recursion limit instead of crashing.
+            self.error = "Nesting too deep"
+        if self.error is None:
             print("Code accepted.")
-        except SyntaxError as e:
-            print("Syntax error:", e)
+        else:
+            print("Syntax error:", self.error)
 
     # ---------------- Grammar rules ----------------
+    # Every rule returns True on success. On failure it returns False, and
+    # self.error holds the message if the failure is a syntax error rather
+    # than just "not this construct".
+    #
+    # statement, declaration, assignment, expression, term and block run for
+    # every statement or operand, so they read self.tok and pull the next
+    # token directly instead of going through peek/advance/match.
     def statement(self) -> bool:
         """Parse a single statement."""
-        tok_type, tok_val = self.peek()
-        if tok_type == 'KEYWORD' and tok_val in {'int', 'float', 'double', 'bool'}:
-            return self.declaration()
-        elif tok_type == 'ID':
+        tok = self.tok
+        if tok[0] == ID:
             return self.assignment()
-        elif tok_type == 'KEYWORD' and tok_val == 'if':
-            return self.if_statement()
-        elif tok_type == 'KEYWORD' and tok_val == 'while':
-            return self.while_loop()
-        elif tok_type == 'KEYWORD' and tok_val == 'for':
-            return self.for_loop()
-        elif tok_type == 'KEYWORD' and tok_val == 'return':
-            return self.return_statement()
-        return False
+        rule = _STATEMENT_RULES.get(tok)
+        if rule is None:
+            return False
+        return rule(self)
 
     def declaration(self) -> bool:
         """Parse a variable declaration with optional initialization."""
-        self.advance()  # skip type
-        if self.match('ID'):
-            if self.match('OP', '='):
-                self.expression()
-            if self.match('SEMI'):
+        tokens = self.tokens
+        tok = next(tokens, _EOF_TOKEN)  # skip type
+        if tok[0] == ID:
+            tok = next(tokens, _EOF_TOKEN)
+            if tok == _ASSIGN:
+                self.tok = next(tokens, _EOF_TOKEN)
+                if not self.expression():
+                    return False
+                tok = self.tok
+            if tok[0] == SEMI:
+                self.tok = next(tokens, _EOF_TOKEN)
                 return True
+        self.tok = tok
         return False
 
     def assignment(self) -> bool:
         """Parse an assignment statement."""
-        self.advance()  # skip identifier
-        if self.match('OP', '='):
-            self.expression()
-            if self.match('SEMI'):
+        tokens = self.tokens
+        tok = next(tokens, _EOF_TOKEN)  # skip identifier
+        if tok == _ASSIGN:
+            self.tok = next(tokens, _EOF_TOKEN)
+            if not self.expression():
+                return False
+            tok = self.tok
+            if tok[0] == SEMI:
+                self.tok = next(tokens, _EOF_TOKEN)
                 return True
+        self.tok = tok
         return False
 
-    def expression(self) -> None:
+    def expression(self) -> bool:
         """Parse a simple expression (arithmetic, comparison, or logic)."""
-        self.term()
-        while self.match('OP') and self.tokens[self.pos - 1][1] in {
-            '+', '-', '*', '/', '%', '||', '&&', '==', '!=', '<', '<=', '>', '>='
-        }:
-            self.term()
+        tokens = self.tokens
+        binops = _BINOP_PAIRS
+        if not self.term():
+            return False
+        while self.tok in binops:
+            self.tok = next(tokens, _EOF_TOKEN)
+            if not self.term():
+                return False
+        return True
 
-    def term(self) -> None:
+    def term(self) -> bool:
         """Parse a term (identifier, number, boolean, or parenthesized expression)."""
-        tok_type, _ = self.peek()
-        if tok_type in {'NUMBER', 'ID', 'KEYWORD'}:
-            self.advance()
-        elif self.match('LPAREN'):
-            self.expression()
-            if not self.match('RPAREN'):
-                raise SyntaxError("Missing closing parenthesis")
-        else:
-            raise SyntaxError(f"Unexpected token in term: {self.peek()}")
+        tok_type = self.tok[0]
+        if tok_type in _TERM_KINDS:
+            self.tok = next(self.tokens, _EOF_TOKEN)
+            return True
+        elif tok_type == LPAREN:
+            self.tok = next(self.tokens, _EOF_TOKEN)
+            if not self.expression():
+                return False
+            if not self.match(RPAREN):
+                return self.fail("Missing closing parenthesis")
+            return True
+        return self.fail(f"Unexpected token in term: {self.peek()}")
 
     def if_statement(self) -> bool:
         """Parse an if or if-else statement."""
         self.advance()  # skip 'if'
-        if not self.match('LPAREN'):
-            raise SyntaxError("Missing '(' after if")
-        self.expression()
-        if not self.match('RPAREN'):
-            raise SyntaxError("Missing ')' after if condition")
+        if not self.match(LPAREN):
+            return self.fail("Missing '(' after if")
+        if not self.expression():
+            return False
+        if not self.match(RPAREN):
+            return self.fail("Missing ')' after if condition")
         if not self.block():
-            raise SyntaxError("Missing block after if")
-        if self.match('KEYWORD', 'else'):
+            return self.fail("Missing block after if")
+        if self.match(KEYWORD, 'else'):
             if not self.block():
-                raise SyntaxError("Missing block after else")
+                return self.fail("Missing block after else")
         return True
 
     def while_loop(self) -> bool:
         """Parse a while loop."""
         self.advance()  # skip 'while'
-        if not self.match('LPAREN'):
-            raise SyntaxError("Missing '(' after while")
-        self.expression()
-        if not self.match('RPAREN'):
-            raise SyntaxError("Missing ')' after while condition")
+        if not self.match(LPAREN):
+            return self.fail("Missing '(' after while")
+        if not self.expression():
+            return False
+        if not self.match(RPAREN):
+            return self.fail("Missing ')' after while condition")
         if not self.block():
-            raise SyntaxError("Missing block after while")
+            return self.fail("Missing block after while")
         return True
 
     def for_loop(self) -> bool:
         """Parse a for loop."""
         self.advance()  # skip 'for'
-        if not self.match('LPAREN'):
-            raise SyntaxError("Missing '(' after for")
-        self.statement()  # initialization
-        self.expression()  # condition
-        self.match('SEMI')
-        self.assignment()  # increment
-        if not self.match('RPAREN'):
-            raise SyntaxError("Missing ')' after for loop")
+        if not self.match(LPAREN):
+            return self.fail("Missing '(' after for")
+        # A malformed initialization or increment is tolerated; only a
+        # syntax error reported inside one of them stops the loop.
+        if not self.statement() and self.error is not None:  # initialization
+            return False
+        if not self.expression():  # condition
+            return False
+        self.match(SEMI)
+        if not self.assignment() and self.error is not None:  # increment
+            return False
+        if not self.match(RPAREN):
+            return self.fail("Missing ')' after for loop")
         if not self.block():
-            raise SyntaxError("Missing block after for")
+            return self.fail("Missing block after for")
         return True
 
     def return_statement(self) -> bool:
         """Parse a return statement."""
         self.advance()  # skip 'return'
-        self.expression()
-        if not self.match('SEMI'):
-            raise SyntaxError("Missing ';' after return")
+        if not self.expression():
+            return False
+        if not self.match(SEMI):
+            return self.fail("Missing ';' after return")
         return True
 
     def block(self) -> bool:
         """Parse a block of statements enclosed in braces."""
-        if self.match('LBRACE'):
-            while not self.match('RBRACE'):
+        tokens = self.tokens
+        if self.tok[0] == LBRACE:
+            self.tok = next(tokens, _EOF_TOKEN)
+            while True:
+                if self.tok[0] == RBRACE:
+                    self.tok = next(tokens, _EOF_TOKEN)
+                    return True
                 if not self.statement():
-                    raise SyntaxError(f"Invalid statement in block: {self.peek()}")
-            return True
+                    return self.fail(f"Invalid statement in block: {self.peek()}")
         return False
 
 
+# Rule for each keyword token that starts a statement, looked up by statement()
+# with the whole lookahead token instead of testing the keywords one by one.
+_STATEMENT_RULES: Dict[Tuple[Kind, str], Callable[[Parser], bool]] = {
+    **{(KEYWORD, type_kw): Parser.declaration for type_kw in _TYPE_KW},
+    (KEYWORD, 'if'): Parser.if_statement,
+    (KEYWORD, 'while'): Parser.while_loop,
+    (KEYWORD, 'for'): Parser.for_loop,
+    (KEYWORD, 'return'): Parser.return_statement,
+}
+
+
 # ---------------- Main Program ----------------
 if __name__ == "__main__":
     print("Enter your C++ code line by line. Type END to finish input:")
@@ -236,7 +374,7 @@ if __name__ == "__main__":
 
     # Scan tokens
     scanner: Scanner = Scanner(code)
-    tokens: List[Tuple[str, str]] = scanner.tokenize()
+    tokens: List[Tuple[Kind, str]] = scanner.tokenize()
     
     print("\nTokens:")
     for token in tokens: